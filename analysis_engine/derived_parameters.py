@@ -111,7 +111,8 @@ from analysis_engine.library import (
     straighten_headings,
     track_linking,
     value_at_index,
-    vstack_params
+    vstack_params,
+    vstack_params_reduce,
 )
 
 from analysis_engine.settings import (
@@ -1752,7 +1753,11 @@ class AOA(DerivedParameterNode):
             # The Angle of Attack recorded in the FDR is "filtered" Body AoA
             # and is not compensated for sideslip, it must be converted back to
             # Vane before it can be used. See Bombardier AOM-1281 document.
-            self.array = self.array * 1.661 - 1.404
+            # The product is a new array so the offset can be removed in
+            # place without touching the source parameter.
+            array = self.array * 1.661
+            array -= 1.404
+            self.array = array
 
 
 class ControlColumn(DerivedParameterNode):
@@ -2004,16 +2009,16 @@ class DistanceToLanding(DerivedParameterNode):
     units = ut.NM
 
     def derive(self, dist=P('Distance Travelled'), tdwns=KTI('Touchdown')):
+        if not tdwns:
+            self.array = np_ma_masked_zeros_like(dist.array)
+            return
         self.array = np.zeros_like(dist.array)
-        if tdwns:
-            last_tdwn = 0
-            for tdwn in tdwns.get_ordered_by_index():
-                this_tdwn = int(tdwn.index)
-                self.array[last_tdwn:this_tdwn+1] = np.ma.abs(dist.array[last_tdwn:this_tdwn+1] - (value_at_index(dist.array, this_tdwn) or np.ma.masked))
-                last_tdwn = this_tdwn+1
-            self.array[last_tdwn:] = np.ma.abs(dist.array[last_tdwn:] - dist.array[this_tdwn])
-        else:
-            self.array.mask = True
+        last_tdwn = 0
+        for tdwn in tdwns.get_ordered_by_index():
+            this_tdwn = int(tdwn.index)
+            self.array[last_tdwn:this_tdwn+1] = np.ma.abs(dist.array[last_tdwn:this_tdwn+1] - (value_at_index(dist.array, this_tdwn) or np.ma.masked))
+            last_tdwn = this_tdwn+1
+        self.array[last_tdwn:] = np.ma.abs(dist.array[last_tdwn:] - dist.array[this_tdwn])
 
 
 class DistanceFlown(DerivedParameterNode):
@@ -2346,8 +2351,7 @@ class Eng_EPRAvg(DerivedParameterNode):
                eng3=P('Eng (3) EPR'),
                eng4=P('Eng (4) EPR')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2370,8 +2374,7 @@ class Eng_EPRMax(DerivedParameterNode):
                eng3=P('Eng (3) EPR'),
                eng4=P('Eng (4) EPR')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2394,8 +2397,7 @@ class Eng_EPRMin(DerivedParameterNode):
                eng3=P('Eng (3) EPR'),
                eng4=P('Eng (4) EPR')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2459,8 +2461,7 @@ class Eng_TPRMax(DerivedParameterNode):
                eng3=P('Eng (3) TPR'),
                eng4=P('Eng (4) TPR')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2483,8 +2484,7 @@ class Eng_TPRMin(DerivedParameterNode):
                eng3=P('Eng (3) TPR'),
                eng4=P('Eng (4) TPR')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2541,8 +2541,7 @@ class Eng_FuelFlowMin(DerivedParameterNode):
                eng3=P('Eng (3) Fuel Flow'),
                eng4=P('Eng (4) Fuel Flow')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
 
 
 class Eng_FuelFlowMax(DerivedParameterNode):
@@ -2569,8 +2568,7 @@ class Eng_FuelFlowMax(DerivedParameterNode):
                eng3=P('Eng (3) Fuel Flow'),
                eng4=P('Eng (4) Fuel Flow')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
 
 
 ##############################################################################
@@ -2684,8 +2682,7 @@ class Eng_GasTempAvg(DerivedParameterNode):
                eng3=P('Eng (3) Gas Temp'),
                eng4=P('Eng (4) Gas Temp')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2708,8 +2705,7 @@ class Eng_GasTempMax(DerivedParameterNode):
                eng3=P('Eng (3) Gas Temp'),
                eng4=P('Eng (4) Gas Temp')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2732,8 +2728,7 @@ class Eng_GasTempMin(DerivedParameterNode):
                eng3=P('Eng (3) Gas Temp'),
                eng4=P('Eng (4) Gas Temp')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -2765,8 +2760,7 @@ class Eng_N1Avg(DerivedParameterNode):
                eng3=P('Eng (3) N1'),
                eng4=P('Eng (4) N1')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
 
 
 class Eng_N1AvgFor10Sec(DerivedParameterNode):
@@ -2806,8 +2800,7 @@ class Eng_N1Max(DerivedParameterNode):
                eng3=P('Eng (3) N1'),
                eng4=P('Eng (4) N1')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
 
 
 class Eng_N1Min(DerivedParameterNode):
@@ -2834,8 +2827,7 @@ class Eng_N1Min(DerivedParameterNode):
                eng3=P('Eng (3) N1'),
                eng4=P('Eng (4) N1')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
 
 
 class Eng_N1Split(DerivedParameterNode):
@@ -2906,8 +2898,7 @@ class Eng_N2Avg(DerivedParameterNode):
                eng3=P('Eng (3) N2'),
                eng4=P('Eng (4) N2')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
 
 
 class Eng_N2Max(DerivedParameterNode):
@@ -2934,8 +2925,7 @@ class Eng_N2Max(DerivedParameterNode):
                eng3=P('Eng (3) N2'),
                eng4=P('Eng (4) N2')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
 
 
 class Eng_N2Min(DerivedParameterNode):
@@ -2962,8 +2952,7 @@ class Eng_N2Min(DerivedParameterNode):
                eng3=P('Eng (3) N2'),
                eng4=P('Eng (4) N2')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
 
 
 ##############################################################################
@@ -2994,8 +2983,7 @@ class Eng_N3Avg(DerivedParameterNode):
                eng3=P('Eng (3) N3'),
                eng4=P('Eng (4) N3')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
 
 
 class Eng_N3Max(DerivedParameterNode):
@@ -3022,8 +3010,7 @@ class Eng_N3Max(DerivedParameterNode):
                eng3=P('Eng (3) N3'),
                eng4=P('Eng (4) N3')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
 
 
 class Eng_N3Min(DerivedParameterNode):
@@ -3050,8 +3037,7 @@ class Eng_N3Min(DerivedParameterNode):
                eng3=P('Eng (3) N3'),
                eng4=P('Eng (4) N3')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
 
 
 ##############################################################################
@@ -3082,8 +3068,7 @@ class Eng_NpAvg(DerivedParameterNode):
                eng3=P('Eng (3) Np'),
                eng4=P('Eng (4) Np')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
 
 
 class Eng_NpMax(DerivedParameterNode):
@@ -3110,8 +3095,7 @@ class Eng_NpMax(DerivedParameterNode):
                eng3=P('Eng (3) Np'),
                eng4=P('Eng (4) Np')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
 
 
 class Eng_NpMin(DerivedParameterNode):
@@ -3138,8 +3122,7 @@ class Eng_NpMin(DerivedParameterNode):
                eng3=P('Eng (3) Np'),
                eng4=P('Eng (4) Np')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
 
 
 ##############################################################################
@@ -3165,8 +3148,7 @@ class Eng_OilPressAvg(DerivedParameterNode):
                eng3=P('Eng (3) Oil Press'),
                eng4=P('Eng (4) Oil Press')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3189,8 +3171,7 @@ class Eng_OilPressMax(DerivedParameterNode):
                eng3=P('Eng (3) Oil Press'),
                eng4=P('Eng (4) Oil Press')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3213,8 +3194,7 @@ class Eng_OilPressMin(DerivedParameterNode):
                eng3=P('Eng (3) Oil Press'),
                eng4=P('Eng (4) Oil Press')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3241,8 +3221,7 @@ class Eng_OilQtyAvg(DerivedParameterNode):
                eng3=P('Eng (3) Oil Qty'),
                eng4=P('Eng (4) Oil Qty')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3265,8 +3244,7 @@ class Eng_OilQtyMax(DerivedParameterNode):
                eng3=P('Eng (3) Oil Qty'),
                eng4=P('Eng (4) Oil Qty')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3289,8 +3267,7 @@ class Eng_OilQtyMin(DerivedParameterNode):
                eng3=P('Eng (3) Oil Qty'),
                eng4=P('Eng (4) Oil Qty')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3317,8 +3294,7 @@ class Eng_OilTempAvg(DerivedParameterNode):
                eng3=P('Eng (3) Oil Temp'),
                eng4=P('Eng (4) Oil Temp')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        avg_array = np.ma.average(engines, axis=0)
+        avg_array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
         if np.ma.count(avg_array) != 0:
             self.array = avg_array
             self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
@@ -3347,8 +3323,7 @@ class Eng_OilTempMax(DerivedParameterNode):
                eng3=P('Eng (3) Oil Temp'),
                eng4=P('Eng (4) Oil Temp')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        max_array = np.ma.max(engines, axis=0)
+        max_array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         if np.ma.count(max_array) != 0:
             self.array = max_array
             self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
@@ -3377,8 +3352,7 @@ class Eng_OilTempMin(DerivedParameterNode):
                eng3=P('Eng (3) Oil Temp'),
                eng4=P('Eng (4) Oil Temp')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        min_array = np.ma.min(engines, axis=0)
+        min_array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         if np.ma.count(min_array) != 0:
             self.array = min_array
             self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
@@ -3411,8 +3385,7 @@ class Eng_TorqueAvg(DerivedParameterNode):
                eng3=P('Eng (3) Torque'),
                eng4=P('Eng (4) Torque')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.average(engines, axis=0)
+        self.array = vstack_params_reduce('average', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3435,8 +3408,7 @@ class Eng_TorqueMax(DerivedParameterNode):
                eng3=P('Eng (3) Torque'),
                eng4=P('Eng (4) Torque')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3458,8 +3430,7 @@ class Eng_TorqueMin(DerivedParameterNode):
                eng3=P('Eng (3) Torque'),
                eng4=P('Eng (4) Torque')):
 
-        engines = vstack_params(eng1, eng2, eng3, eng4)
-        self.array = np.ma.min(engines, axis=0)
+        self.array = vstack_params_reduce('min', eng1, eng2, eng3, eng4)
         self.offset = offset_select('mean', [eng1, eng2, eng3, eng4])
 
 
@@ -3521,8 +3492,7 @@ class Eng_VibN1Max(DerivedParameterNode):
                gear2=P('Eng (2) Vib N1 Gearbox')):
 
         params = eng1, eng2, eng3, eng4, fan1, fan2, fan3, fan4, lpt1, lpt2, lpt3, lpt4, comp1, comp2, gear1, gear2
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -3558,8 +3528,7 @@ class Eng_VibN2Max(DerivedParameterNode):
                hpt4=P('Eng (4) Vib N2 Turbine')):
 
         params = eng1, eng2, eng3, eng4, hpc1, hpc2, hpt1, hpt2, hpt3, hpt4
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -3593,8 +3562,7 @@ class Eng_VibN3Max(DerivedParameterNode):
                hpt4=P('Eng (4) Vib N3 Turbine')):
 
         params = eng1, eng2, eng3, eng4, hpt1, hpt2, hpt3, hpt4
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -3641,8 +3609,7 @@ class Eng_VibBroadbandMax(DerivedParameterNode):
                   eng1_accel_a, eng2_accel_a, eng3_accel_a, eng4_accel_a,
                   eng1_accel_b, eng2_accel_b, eng3_accel_b, eng4_accel_b)
 
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -3674,8 +3641,7 @@ class Eng_VibNpMax(DerivedParameterNode):
                gear2=P('Eng (2) Vib Np Gearbox')):
 
         params = eng1, eng2, fan1, fan2, lpt1, lpt2, comp1, comp2, gear1, gear2
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 ##############################################################################
@@ -3704,8 +3670,7 @@ class Eng_VibAMax(DerivedParameterNode):
                eng4=P('Eng (4) Vib (A)')):
 
         params = eng1, eng2, eng3, eng4
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -3735,8 +3700,7 @@ class Eng_VibBMax(DerivedParameterNode):
                eng4=P('Eng (4) Vib (B)')):
 
         params = eng1, eng2, eng3, eng4
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -3766,8 +3730,7 @@ class Eng_VibCMax(DerivedParameterNode):
                eng4=P('Eng (4) Vib (C)')):
 
         params = eng1, eng2, eng3, eng4
-        engines = vstack_params(*params)
-        self.array = np.ma.max(engines, axis=0)
+        self.array = vstack_params_reduce('max', *params)
         self.offset = offset_select('mean', params)
 
 
@@ -4750,7 +4713,7 @@ class Heading(DerivedParameterNode):
 
     def derive(self, head_true=P('Heading True Continuous'),
                mag_var=P('Magnetic Variation')):
-        self.array = (head_true.array - mag_var.array) % 360.0
+        self.array = np.ma.mod(head_true.array - mag_var.array, 360.0)
 
 
 class HeadingTrue(DerivedParameterNode):
@@ -4778,7 +4741,7 @@ class HeadingTrue(DerivedParameterNode):
                rwy_var=P('Magnetic Variation From Runway'),
                mag_var=P('Magnetic Variation')):
         var = rwy_var.array if rwy_var else mag_var.array
-        self.array = (head.array + var) % 360.0
+        self.array = np.ma.mod(head.array + var, 360.0)
 
 
 class ILSFrequency(DerivedParameterNode):
@@ -5608,8 +5571,7 @@ class MagneticVariationFromRunway(DerivedParameterNode):
                head_land = KPV('Heading During Landing'),
                toff_rwy = A('FDR Takeoff Runway'),
                land_rwy = A('FDR Landing Runway')):
-        dev = np_ma_zeros_like(mag.array)
-        dev.mask = True
+        dev = np_ma_masked_zeros_like(mag.array)
 
         # takeoff
         tof_hdg_mag_kpv = head_toff.get_first()
@@ -5860,7 +5822,9 @@ class VerticalSpeedForFlightPhases(DerivedParameterNode):
         # This uses a scaled hysteresis parameter. See settings for more detail.
         threshold = HYSTERESIS_FPROC * max(1, rms_noise(alt_std.array) or 1)
         # The max(1, prevents =0 case when testing with artificial data.
-        self.array = hysteresis(rate_of_change(alt_std, 6) * 60, threshold)
+        roc = rate_of_change(alt_std, 6)
+        roc *= 60
+        self.array = hysteresis(roc, threshold)
 
 
 class VerticalSpeedFor3Sec(DerivedParameterNode):
@@ -6865,7 +6829,9 @@ class Headwind(DerivedParameterNode):
                 # mask windspeed data while going slow
                 windspeed.array[aspd.array.mask] = np.ma.masked
             rad_scale = radians(1.0)
-            headwind = windspeed.array * np.ma.cos((wind_dir.array-head.array)*rad_scale)
+            # Scale the cosine in place rather than allocating the product.
+            headwind = np.ma.cos((wind_dir.array-head.array)*rad_scale)
+            headwind *= windspeed.array
 
             # If we have airspeed and groundspeed, overwrite the values for the
             # altitudes below one hundred feet.
@@ -7017,7 +6983,6 @@ class WindAcrossLandingRunway(DerivedParameterNode):
             # proceed with "True" values
             wind_dir = wind_dir_true
             land_heading = runway_heading(land_rwy.value)
-            self.array = np_ma_masked_zeros_like(wind_dir_true.array)
         elif wind_dir_mag and land_hdg:
             # proceed with "Magnetic" values
             wind_dir = wind_dir_mag
@@ -7028,8 +6993,11 @@ class WindAcrossLandingRunway(DerivedParameterNode):
             self.warning('Cannot calculate without landing runway (%s) or landing heading (%s)',
                          bool(land_rwy), bool(land_hdg))
             return
+        # The sine is a new float array, so it is scaled in place.
         diff = (land_heading - wind_dir.array) * deg2rad
-        self.array = windspeed.array * np.ma.sin(diff)
+        across = np.ma.sin(diff)
+        across *= windspeed.array
+        self.array = across
 
 
 class Aileron(DerivedParameterNode):
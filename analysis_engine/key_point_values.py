@@ -543,9 +543,10 @@ class AccelerationLongitudinalOffset(KeyPointValueNode):
         Get the unmasked data within the taxis slices provided and compute
         the average for this section(s) if there are enough samples.
         '''
-        unmasked_data = []
-        for taxi in slices_int(taxis):
-            unmasked_data.extend(np.ma.compressed(acc_lon.array[taxi]))
+        taxi_data = [np.ma.compressed(acc_lon.array[taxi]) for taxi in slices_int(taxis)]
+        if not taxi_data:
+            return
+        unmasked_data = np.concatenate(taxi_data)
         if len(unmasked_data) > 20:
             delta = np.sum(unmasked_data) / float(len(unmasked_data))
             self.create_kpv(0, delta)
@@ -1194,9 +1195,10 @@ class AccelerationNormalOffset(KeyPointValueNode):
         Get the unmasked data within the taxiing slices provided and compute
         the average for this section(s) if there are enough samples.
         '''
-        unmasked_data = []
-        for taxi in slices_int(taxiing.get_slices()):
-            unmasked_data.extend(np.ma.compressed(acc_norm.array[taxi]))
+        taxi_data = [np.ma.compressed(acc_norm.array[taxi]) for taxi in slices_int(taxiing.get_slices())]
+        if not taxi_data:
+            return
+        unmasked_data = np.concatenate(taxi_data)
         if len(unmasked_data) > 20:
             delta = np.sum(unmasked_data) / float(len(unmasked_data)) - 1.0
             self.create_kpv(0, delta + 1.0)
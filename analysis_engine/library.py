@@ -12,7 +12,7 @@ from numpy.ma.extras import _ezclump as ezclump
 import pytz
 
 from builtins import zip
-from collections import OrderedDict, namedtuple
+from collections import namedtuple
 from copy import copy, deepcopy
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -20,6 +20,7 @@ from hashlib import sha256
 from math import ceil, copysign, cos, floor, log, radians, sin, sqrt
 from operator import itemgetter
 from scipy import interpolate as scipy_interpolate, optimize
+from scipy.linalg import solve_banded
 from scipy.ndimage import filters
 from scipy.signal import medfilt
 from six.moves import zip_longest
@@ -432,14 +433,13 @@ def align_args(slave_array, slave_frequency, slave_offset, master_frequency, mas
     if len_aligned != (len(slave_array) * r):
         raise ValueError("Array length problem in align. Probable cause is flight cutting not at superframe boundary")
 
-    slave_aligned = np.ma.zeros(int(len(slave_array) * r), dtype=_dtype)
-
     # Where offsets are equal, the slave_array recorded values remain
     # unchanged and interpolation is performed between these values.
     # - and we do not interpolate mapped arrays!
     if not delta and interpolate and (is_power2(slave_frequency) and
                                       is_power2(master_frequency)):
-        slave_aligned.mask = True
+        slave_aligned = np.ma.array(np.zeros(len_aligned, dtype=_dtype),
+                                    mask=True)
         if master_frequency > slave_frequency:
             # populate values and interpolate
             slave_aligned[0::int(r)] = slave_array[0::1]
@@ -461,6 +461,12 @@ def align_args(slave_array, slave_frequency, slave_offset, master_frequency, mas
     # wm & ws used for indexing from now on ensure they are integars
     wm = int(wm)
     ws = int(ws)
+    # Interpolate the raw data and combine the masks separately; a result is
+    # masked if either of the slave samples it is drawn from is masked.
+    slave_data = np.ma.getdata(slave_array)
+    slave_mask = np.ma.getmaskarray(slave_array)
+    aligned_data = np.zeros(len_aligned, dtype=_dtype)
+    aligned_mask = np.zeros(len_aligned, dtype=bool)
     # Each sample in the master parameter may need different combination parameters
     for i in range(wm):
         bracket = (i / r) + delta
@@ -485,27 +491,49 @@ def align_args(slave_array, slave_frequency, slave_offset, master_frequency, mas
             if h<-ws:
                 raise ValueError('Align called with excessive timing mismatch')
             # slave_array values do not exist in aligned array
-            if ws==1:
-                slave_aligned[i+wm::wm] = a*slave_array[h+ws:-ws:ws] + b*slave_array[h1+ws::ws]
-            else:
-                slave_aligned[i+wm::wm] = a*slave_array[h+ws:-ws:ws] + b*slave_array[h1+ws:1-ws:ws]
+            dest = slice(i+wm, None, wm)
+            src_a = slice(h+ws, -ws, ws)
+            src_b = slice(h1+ws, None, ws) if ws==1 else slice(h1+ws, 1-ws, ws)
             # We can't interpolate the inital values as we are outside the
             # range of the slave parameters.
             # Treat ends as "padding"; Value of 0 and Masked.
-            slave_aligned[i] = 0
-            slave_aligned[i] = np.ma.masked
+            pad = i
         elif h1 >= ws:
-            slave_aligned[i:-wm:wm] = a*slave_array[h:-ws:ws] + b*slave_array[h1::ws]
+            dest = slice(i, -wm, wm)
+            src_a = slice(h, -ws, ws)
+            src_b = slice(h1, None, ws)
             # At the other end, we run out of slave parameter values so need to
             # pad to the end of the array.
             # Treat ends as "padding"; Value of 0 and Masked.
-            slave_aligned[i-wm] = 0
-            slave_aligned[i-wm] = np.ma.masked
+            pad = i-wm
         else:
             # Sheer bliss. We can compute slave_aligned across the whole
             # range of the data without having to take special care at the
             # ends of the array.
-            slave_aligned[i::wm] = a*slave_array[h::ws] + b*slave_array[h1::ws]
+            dest = slice(i, None, wm)
+            src_a = slice(h, None, ws)
+            src_b = slice(h1, None, ws)
+            pad = None
+
+        # Where the master sample coincides with a slave sample (always the
+        # case without interpolation) copy it rather than computing a*x + 0*y.
+        # Otherwise write straight into the strided view of the result so
+        # only one temporary of this phase's length is needed.
+        dest_data = aligned_data[dest]
+        if b == 0:
+            dest_data[:] = slave_data[src_a]
+        elif a == 0:
+            dest_data[:] = slave_data[src_b]
+        else:
+            np.multiply(slave_data[src_a], a, out=dest_data)
+            dest_data += b * slave_data[src_b]
+        np.logical_or(slave_mask[src_a], slave_mask[src_b],
+                      out=aligned_mask[dest])
+        if pad is not None:
+            aligned_data[pad] = 0
+            aligned_mask[pad] = True
+
+    slave_aligned = np.ma.array(aligned_data, mask=aligned_mask)
 
     if isinstance(original_array, MappedArray) or original_array.dtype.type is np.string_:
         # return back to mapped array
@@ -631,30 +659,34 @@ def bearings_and_distances(latitudes, longitudes, reference):
     suit the POLARIS project.
     """
 
-    lat_array = latitudes * deg2rad
-    lon_array = longitudes * deg2rad
+    # Work on the raw data; the joined input mask is applied to both results
+    # at the end.
+    lat_array = np.ma.getdata(latitudes) * deg2rad
+    lon_array = np.ma.getdata(longitudes) * deg2rad
     lat_ref = radians(reference['latitude'])
     lon_ref = radians(reference['longitude'])
+    cos_lat_ref = cos(lat_ref)
+    sin_lat_ref = sin(lat_ref)
 
     dlat = lat_array - lat_ref
     dlon = lon_array - lon_ref
+    cos_lat = np.cos(lat_array)
 
-    a = np.ma.sin(dlat/2)**2 + \
-        np.ma.cos(lat_array) * np.ma.cos(lat_ref) * np.ma.sin(dlon/2)**2
-    dists = 2 * np.ma.arctan2(np.ma.sqrt(a), np.ma.sqrt(1.0 - a))
+    a = np.sin(dlat/2)**2 + cos_lat * cos_lat_ref * np.sin(dlon/2)**2
+    # Rounding can take a fractionally outside 0-1 for antipodal points.
+    a = np.clip(a, 0.0, 1.0)
+    dists = 2 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
     dists *= 6371000 # Earth radius in metres
 
+    y = np.sin(dlon) * cos_lat
+    x = cos_lat_ref * np.sin(lat_array) - sin_lat_ref * cos_lat * np.cos(dlon)
+    brgs = np.rad2deg(np.arctan2(y, x))
+    brgs %= 360
 
-    y = np.ma.sin(dlon) * np.ma.cos(lat_array)
-    x = np.ma.cos(lat_ref) * np.ma.sin(lat_array) \
-        - np.ma.sin(lat_ref) * np.ma.cos(lat_array) * np.ma.cos(dlon)
-    brgs = np.ma.arctan2(y,x)
-
-    joined_mask = np.logical_or(latitudes.mask, longitudes.mask)
-    brg_array = np.ma.array(data=np.rad2deg(brgs) % 360,
-                            mask=joined_mask)
-    dist_array = np.ma.array(data=dists,
-                             mask=joined_mask)
+    joined_mask = np.logical_or(np.ma.getmask(latitudes),
+                                np.ma.getmask(longitudes))
+    brg_array = np.ma.array(data=brgs, mask=joined_mask)
+    dist_array = np.ma.array(data=dists, mask=joined_mask)
 
     return brg_array, dist_array
 
@@ -867,56 +899,61 @@ def calculate_timebase(years, months, days, hours, mins, secs):
     :rtype: datetime
     :raises: InvalidDatetime if no valid timestamps provided
     """
-    base_dt = None
-    # Calculate current year here and pass into
-    # convert_two_digit_to_four_digit_year to save calculating year for every
-    # second of flight
-    current_year = str(datetime.utcnow().year)
-    # OrderedDict so if all values are the same, max will consistently take the
-    # first val on repeated runs
-    clock_variation = OrderedDict()
-
     if not len(years) == len(months) == len(days) == \
        len(hours) == len(mins) == len(secs):
         raise ValueError("Arrays must be of same length")
 
-    for step, (yr, mth, day, hr, mn, sc) in enumerate(np.ma.dstack((years, months, days, hours, mins, secs))[0]):
-
-        #TODO: Try using numpy datetime functions for speedup?
-        #try:
-            #date = np.datetime64('%d-%d-%d' % (yr, mth, day), 'D')
-        #except np.core._mx_datetime_parser.RangeError  :
-            #continue
-        # same for time?
-
-        if yr is not None and yr is not np.ma.masked and yr < 100:
-            yr = convert_two_digit_to_four_digit_year(yr, current_year)
-
-        try:
-            dt = datetime(int(yr), int(mth), int(day), int(hr), int(mn), int(sc), tzinfo=pytz.utc)
-        except (ValueError, TypeError, np.ma.core.MaskError):
-            # ValueError is raised if values are out of range, e.g. 0..59.
-            # Q: Should we validate these parameters and switch to fallback_dt
-            #    if it fails?
-            continue
-        if not base_dt:
-            base_dt = dt # store reference datetime
-        # calc diff from base
-        diff = dt - base_dt - timedelta(seconds=step)
-        ##print("%02d - %s %s" % (step, dt, diff))
-        try:
-            clock_variation[diff] += 1
-        except KeyError:
-            # new difference
-            clock_variation[diff] = 1
-    if base_dt:
-        # return most regular difference
-        clock_delta = max(clock_variation, key=clock_variation.get)
-        return base_dt + clock_delta
-    else:
+    # Truncate each time element to an integer as datetime() would, treating
+    # masked, missing (None), non-finite and out of range values as invalid.
+    elements = []
+    valid = np.ones(len(years), dtype=bool)
+    for values in (years, months, days, hours, mins, secs):
+        array = np.ma.asarray(values)
+        mask = np.ma.getmaskarray(array)
+        data = np.ma.getdata(array)
+        if data.dtype == object:
+            mask = mask | np.equal(data, None)
+            data = np.where(mask, 0, data)
+        data = data.astype(np.float64)
+        valid &= ~mask & (np.abs(data) < 1e6)
+        elements.append(np.trunc(np.where(valid, data, 0)).astype(np.int64))
+    yr, mth, day, hr, mn, sc = elements
+
+    # Two digit years are converted together, with the current year
+    # calculated once.
+    current_year = str(datetime.utcnow().year)
+    yr = np.where(yr < 100,
+                  convert_two_digit_to_four_digit_year(yr, current_year), yr)
+
+    valid &= (yr >= 1) & (yr <= 9999) & (mth >= 1) & (mth <= 12) & \
+        (hr >= 0) & (hr <= 23) & (mn >= 0) & (mn <= 59) & \
+        (sc >= 0) & (sc <= 59) & (day >= 1)
+    month_start = np.where(valid, (yr - 1970) * 12 + mth - 1, 0)
+    month_start = month_start.astype('datetime64[M]').astype('datetime64[D]')
+    month_end = (np.where(valid, (yr - 1970) * 12 + mth, 1)
+                 .astype('datetime64[M]').astype('datetime64[D]'))
+    valid &= day <= (month_end - month_start).astype(np.int64)
+
+    steps = np.flatnonzero(valid)
+    if not len(steps):
         # No valid datestamps found
         raise InvalidDatetime("No valid datestamps found")
 
+    # Seconds since the epoch of each valid timestamp, less its offset into
+    # the array, give the start time implied by that sample.
+    epoch_days = (month_start[valid] - np.datetime64(0, 'D')).astype(np.int64)
+    starts = (epoch_days + day[valid] - 1) * 86400 + hr[valid] * 3600 + \
+        mn[valid] * 60 + sc[valid] - steps
+
+    # Return the most regular start time; where several are equally common
+    # the first one seen is taken, so repeated runs are consistent.
+    values, first_seen, counts = np.unique(starts, return_index=True,
+                                           return_counts=True)
+    most_common = counts == counts.max()
+    start = values[most_common][np.argmin(first_seen[most_common])]
+    return datetime(1970, 1, 1, tzinfo=pytz.utc) + \
+        timedelta(seconds=int(start))
+
 
 def convert_two_digit_to_four_digit_year(yr, current_year):
     """
@@ -929,10 +966,15 @@ def convert_two_digit_to_four_digit_year(yr, current_year):
     12 = 2012
     11 = 2011
     01 = 2001
+
+    yr may also be an array of two digit years, which are converted in a
+    single vectorised pass.
     """
     # convert to 4 digit year
     century = int(current_year[:2]) * 100
     yy = int(current_year[2:])
+    if np.ndim(yr):
+        return np.where(yr > yy, century - 100 + yr, century + yr)
     if yr > yy:
         return century - 100 + yr
     else:
@@ -986,22 +1028,23 @@ def coreg(y, indep_var=None, force_zero=False):
             raise ValueError('Function coreg called with arrays of differing '
                              'length')
 
-    # Need to propagate masks into both arrays equally.
-    mask = np.ma.logical_or(x.mask, y.mask)
-    x = np.ma.array(data=x.data, mask=mask, dtype=np.float64)
-    y = np.ma.array(data=y.data, mask=mask, dtype=np.float64)
+    # Need to propagate masks into both arrays equally; only the pairs where
+    # both values are valid are used.
+    valid = ~(np.ma.getmaskarray(x) | np.ma.getmaskarray(y))
+    x = np.asarray(np.ma.getdata(x), dtype=np.float64)[valid]
+    y = np.asarray(np.ma.getdata(y), dtype=np.float64)[valid]
 
-    if x.ptp() == 0.0 or y.ptp() == 0.0:
+    if not len(x) or np.ptp(x) == 0.0 or np.ptp(y) == 0.0:
         # raise ValueError('Function coreg called with invariant independent variable')
         return None, None, None
 
     # n is the number of useful data pairs for analysis.
-    n = np.float64(np.ma.count(x))
-    sx = np.ma.sum(x)
-    sxy = np.ma.sum(x*y)
-    sy = np.ma.sum(y)
-    sx2 = np.ma.sum(x*x)
-    sy2 = np.ma.sum(y*y)
+    n = np.float64(len(x))
+    sx = np.sum(x)
+    sxy = np.dot(x, y)
+    sy = np.sum(y)
+    sx2 = np.dot(x, x)
+    sy2 = np.dot(y, y)
 
     # Correlation
     try: # in case sqrt of a negative number is attempted
@@ -1484,17 +1527,24 @@ def closest_unmasked_value(array, index, start_index=None, stop_index=None):
     start_index = positive_index(array, start_index)
     stop_index = positive_index(array, stop_index)
 
-    prev_value = prev_unmasked_value(array, index, start_index=start_index)
-    next_value = next_unmasked_value(array, index, stop_index=stop_index)
-    if prev_value and next_value:
-        if abs(prev_value.index - index) < abs(next_value.index - index):
-            return prev_value
-        else:
-            return next_value
-    elif prev_value:
-        return prev_value
-    elif next_value:
-        return next_value
+    # Search backwards within [start_index, index] and forwards within
+    # [index, stop_index) using a single pass over the unmasked indices.
+    # Indices still negative after flooring are wrapped once more, as
+    # prev_unmasked_value and next_unmasked_value would.
+    index = positive_index(array, index)
+    start = int(start_index) if start_index else 0
+    stop = len(array) if stop_index is None else int(stop_index)
+    offset = min(start, index)
+    valid = np.flatnonzero(~array.mask[offset:max(stop, index + 1)]) + offset
+    pos = np.searchsorted(valid, index)
+
+    prev_index = valid[pos - 1] if pos and valid[pos - 1] >= start else None
+    next_index = valid[pos] if pos < len(valid) and valid[pos] < stop else None
+    if prev_index is not None and (next_index is None or
+                                   index - prev_index < next_index - index):
+        return Value(prev_index, array[prev_index])
+    elif next_index is not None:
+        return Value(next_index, array[next_index])
     else:
         return None
 
@@ -1682,21 +1732,23 @@ def filter_vor_ils_frequencies(array, navaid):
 
     :returns: Numpy masked array. The requested navaid type frequencies will be passed as valid. All other frequencies will be masked.
     '''
-    vor_range = np.ma.masked_outside(array, 108.0, 117.95)
-    ils_range = np.ma.masked_greater(vor_range, 111.95)
+    data = np.ma.getdata(array)
 
     # This finds the four sequential frequencies, so fours has values:
     #   0 = .Even0, 1 = .Even5, 2 = .Odd0, 3 = .Odd5
     # The round function is essential as using floating point values leads to inexact values.
-    fours = np.ma.round(array * 20) % 4
+    fours = np.round(data * 20) % 4
 
-    # Remove frequencies outside the operating range.
+    # Remove frequencies outside the operating range, building the mask in a
+    # single boolean expression.
     if navaid == 'ILS':
-        return np.ma.masked_where(fours < 2.0, ils_range)
+        invalid = (data < 108.0) | (data > 111.95) | (fours < 2.0)
     elif navaid == 'VOR':
-        return np.ma.masked_where(fours > 1.0, vor_range)
+        invalid = (data < 108.0) | (data > 117.95) | (fours > 1.0)
     else:
         raise ValueError('Navaid of unrecognised type %s' % navaid)
+    return np.ma.array(data, mask=np.ma.getmaskarray(array) | invalid,
+                       copy=True)
 
 
 def find_app_rwy(app_info, this_loc):
@@ -2433,8 +2485,14 @@ def runway_deviation(array, runway={}, heading=None):
         rwy_hdg = float(heading)
     else:
         rwy_hdg = runway_heading(runway)
-    dev = (array - rwy_hdg) % 360
-    return np.ma.where(dev>180.0, dev-360.0, dev)
+    # Work on one float copy: wrap to 0-360, then bring the values above 180
+    # round to negative deviations in place.
+    dev = np.ma.array(array, dtype=np.float64, copy=True)
+    dev -= rwy_hdg
+    dev %= 360
+    data = dev.data
+    np.subtract(data, 360.0, out=data, where=data > 180.0)
+    return dev
 
 
 def heading_diff(heading1, heading2):
@@ -4450,10 +4508,12 @@ def merge_sources(*arrays):
     :returns: masked array with merging algorithm applied.
     :rtype: masked array
     '''
-    result = np.ma.empty((len(arrays[0]),len(arrays)))
+    # Write each source into its interleaved slots with a strided slice.
+    step = len(arrays)
+    result = np.ma.empty(len(arrays[0]) * step)
     for dim, array in enumerate(arrays):
-        result[:,dim] = array
-    return np.ma.ravel(result)
+        result[dim::step] = array
+    return result
 
 
 def blend_equispaced_sensors(array_one, array_two):
@@ -4472,33 +4532,35 @@ def blend_equispaced_sensors(array_one, array_two):
     '''
     assert len(array_one) == len(array_two)
     both = merge_sources(array_one, array_two)
+    # Work on the raw data with the masks tracked alongside, rather than
+    # through masked array arithmetic.
+    both_data = np.ma.getdata(both)
     both_mask = np.ma.getmaskarray(both)
 
-    av_other = np_ma_masked_zeros_like(both)
-    av_other[1:-1] = (both[:-2] + both[2:])/2.0
-    av_other[0] = both[1]
-    av_other[-1] = both[-2]
-    av_other_mask = np.ma.getmaskarray(av_other)
+    # The mean of the before and after samples of the other channel.
+    av_other = np.empty(len(both_data))
+    av_other_mask = np.empty(len(both_data), dtype=bool)
+    av_other[1:-1] = (both_data[:-2] + both_data[2:])/2.0
+    av_other_mask[1:-1] = both_mask[:-2] | both_mask[2:]
+    av_other[0] = both_data[1]
+    av_other_mask[0] = both_mask[1]
+    av_other[-1] = both_data[-2]
+    av_other_mask[-1] = both_mask[-2]
 
-    best = (both + av_other)/2.0
-    best_mask = np.ma.getmaskarray(best)
+    best = (both_data + av_other)/2.0
+    best_mask = both_mask | av_other_mask
 
     # We build up the best available data starting from the worst case, where
-    # we have no valid data, so return a masked zero
-    result = np_ma_masked_zeros_like(both)
-
-    # If the other channel is valid, use the average of the before and after
-    # samples of the other channel.
-    result = np.ma.where(av_other_mask, result, av_other)
+    # we have no valid data, so return a masked zero. If the other channel is
+    # valid, use the average of the before and after samples of the other
+    # channel. Better - if the channel sampled at the right moment is valid,
+    # use this. Best option is this channel averaged with the mean of the
+    # other channel before and after samples.
+    result = np.where(av_other_mask, 0.0, av_other)
+    result = np.where(both_mask, result, both_data)
+    result = np.where(best_mask, result, best)
 
-    # Better - if the channel sampled at the right moment is valid, use this.
-    result = np.ma.where(both_mask, result, both)
-
-    # Best option is this channel averaged with the mean of the other channel
-    # before and after samples.
-    result = np.ma.where(best_mask, result, best)
-
-    return result
+    return np.ma.array(result, mask=both_mask & av_other_mask)
 
 
 def blend_nonequispaced_sensors(array_one, array_two, padding):
@@ -4521,30 +4583,36 @@ def blend_nonequispaced_sensors(array_one, array_two, padding):
     assert len(array_one) == len(array_two)
 
     both = merge_sources(array_one, array_two)
-    mask_array = np.ma.getmaskarray(both)
-    first_mask = mask_array[0]
-    last_mask = mask_array[-1]
-    mask_array[0] = False
-    mask_array[-1] = False
-
-    mean_array = np.divide(np.roll(both, -1) + np.roll(both, 1), 2.0)
-    both[mask_array] = mean_array[mask_array]
-    if first_mask:
-        both[0] = np.ma.masked
-    if last_mask:
-        both[-1] = np.ma.masked
+    # Work on copies of the raw data and mask rather than through masked
+    # array arithmetic.
+    data = np.ma.getdata(both).copy()
+    mask = np.ma.getmaskarray(both).copy()
+
+    # Replace masked samples, other than the ends, with the mean of their
+    # neighbours. The end samples keep their own mask but count as valid
+    # neighbours, so a filled sample stays masked only where a neighbour is
+    # another interior masked sample.
+    fill = mask.copy()
+    fill[0] = False
+    fill[-1] = False
+    mean_array = (np.roll(data, -1) + np.roll(data, 1)) / 2.0
+    data[fill] = mean_array[fill]
+    mask[fill] = (np.roll(fill, -1) | np.roll(fill, 1))[fill]
 
     # A simpler technique than trying to append to the averaged array.
-    av_pairs = np.ma.empty_like(both)
+    av_pairs = np.empty_like(data)
+    av_pairs_mask = np.empty(len(data), dtype=bool)
     if padding == 'Follow':
-        av_pairs[:-1] = (both[:-1]+both[1:])/2
+        av_pairs[:-1] = (data[:-1]+data[1:])/2
+        av_pairs_mask[:-1] = mask[:-1] | mask[1:]
         av_pairs[-1] = av_pairs[-2]
-        av_pairs[-1] = np.ma.masked
+        av_pairs_mask[-1] = True
     else:
-        av_pairs[1:] = (both[:-1]+both[1:])/2
+        av_pairs[1:] = (data[:-1]+data[1:])/2
+        av_pairs_mask[1:] = mask[:-1] | mask[1:]
         av_pairs[0] = av_pairs[1]
-        av_pairs[0] = np.ma.masked
-    return av_pairs
+        av_pairs_mask[0] = True
+    return np.ma.array(av_pairs, mask=av_pairs_mask)
 
 def blend_two_parameters(param_one, param_two, mode=None):
     '''
@@ -5664,17 +5732,17 @@ def rate_of_change_array(to_diff, hz, width=None, method='two_points'):
 
     if method == 'two_points':
         input_mask = np.ma.getmaskarray(to_diff)
-        # Set up an array of masked zeros for extending arrays.
-        slope = np.ma.copy(to_diff)
-        slope[hw:-hw] = (to_diff[2*hw:] - to_diff[:-2*hw]) / hw2 * hz
-        slope[:hw] = (to_diff[1:hw+1] - to_diff[0:hw]) * hz
-        slope[-hw:] = (to_diff[-hw:] - to_diff[-hw-1:-1])* hz
-        slope.mask = np.logical_or(input_mask, np.ma.getmaskarray(slope))
-        for i in range(-hw,0):
-            slope.mask[:i] = np.logical_or(input_mask[-i:], slope.mask[:i])
-        for i in range(1,hw+1):
-            slope.mask[i:] = np.logical_or(input_mask[:-i], slope.mask[i:])
-        return slope
+        # The differences are taken on the raw data as the mask is rebuilt
+        # below, so there is no need to carry masks through the arithmetic.
+        data = np.ma.getdata(to_diff)
+        slope = np.empty_like(data)
+        slope[hw:-hw] = (data[2*hw:] - data[:-2*hw]) / hw2 * hz
+        slope[:hw] = (data[1:hw+1] - data[0:hw]) * hz
+        slope[-hw:] = (data[-hw:] - data[-hw-1:-1])* hz
+        # Mask every sample within hw of a masked input sample in one pass;
+        # this covers the samples masked by the differences above.
+        return np.ma.array(
+            slope, mask=np.convolve(input_mask, np.ones(hw2 + 1), 'same') > 0)
 
     elif method == 'regression':
         # Neat solution; works well, but for height data smoothing the raw
@@ -7154,18 +7222,7 @@ def smooth_track_cost_function(lat_s, lon_s, lat, lon, ac_type, hz):
     from_straight = np.sum(np.convolve(lat_s,slider,'valid')**2) + \
         np.sum(np.convolve(lon_s,slider,'valid')**2)
 
-    if ac_type and ac_type.value=='helicopter':
-        weight = 100 # As helicopters fly more slowly so we don't need such smoothing.
-    elif hz == 1.0:
-        weight = 1000
-    elif hz == 0.5:
-        weight = 300
-    elif hz == 0.25:
-        weight = 100
-    else:
-        raise ValueError('Lat/Lon sample rate not recognised in smooth_track_cost_function.')
-
-    cost = from_data + weight*from_straight
+    cost = from_data + _smooth_track_weight(ac_type, hz)*from_straight
     return cost
 
 
@@ -7225,6 +7282,63 @@ def smooth_signal(array, window_len=11, window='hanning'):
     return np.ma.MaskedArray(out[extra_start:-(extra-extra_start)], array.mask)
 
 
+def _smooth_track_weight(ac_type, hz):
+    '''
+    Weight given to departures from a straight line in the smooth_track cost
+    function.
+    '''
+    if ac_type and ac_type.value=='helicopter':
+        return 100 # As helicopters fly more slowly so we don't need such smoothing.
+    elif hz == 1.0:
+        return 1000
+    elif hz == 0.5:
+        return 300
+    elif hz == 0.25:
+        return 100
+    else:
+        raise ValueError('Lat/Lon sample rate not recognised in smooth_track_cost_function.')
+
+
+def _smooth_track_cost(lat_s, lon_s, lat, lon, lat_valid, lon_valid, weight):
+    '''
+    smooth_track_cost_function on plain arrays, where lat_valid and lon_valid
+    exclude samples masked in the recorded data from the data error.
+    '''
+    from_data = np.sum((lat_s - lat)[lat_valid]**2) + \
+        np.sum((lon_s - lon)[lon_valid]**2)
+    slider = np.array([-1,2,-1])
+    from_straight = np.sum(np.convolve(lat_s,slider,'valid')**2) + \
+        np.sum(np.convolve(lon_s,slider,'valid')**2)
+    return from_data + weight*from_straight
+
+
+def _smooth_track_solve(data, valid, weight):
+    '''
+    Minimise the smooth_track cost for one coordinate directly.
+
+    The cost sum(valid*(s - data)**2) + weight*sum(second_difference(s)**2)
+    is minimised where (diag(valid) + weight*D'D) s = valid*data, with D the
+    second difference operator. The matrix is pentadiagonal so this is a
+    single O(n) banded solve. data may have one column per coordinate sharing
+    the same valid samples, in which case they are solved together.
+    '''
+    n = len(data)
+    # Diagonals of D'D.
+    main = np.full(n, 6.0)
+    main[[0, -1]] = 1.0
+    main[[1, -2]] = 5.0
+    first = np.full(n - 1, -4.0)
+    first[[0, -1]] = -2.0
+    # Banded storage as used by solve_banded, two bands either side.
+    ab = np.zeros((5, n))
+    ab[0, 2:] = weight
+    ab[1, 1:] = weight * first
+    ab[2] = valid + weight * main
+    ab[3, :-1] = weight * first
+    ab[4, :-2] = weight
+    return solve_banded((2, 2), ab, np.where(valid, data.T, 0.0).T)
+
+
 def smooth_track(lat, lon, ac_type, hz):
     """
     Input:
@@ -7234,41 +7348,35 @@ def smooth_track(lat, lon, ac_type, hz):
     hz = sample rate
 
     Returns:
-    lat_last = Optimised latitude array
-    lon_last = optimised longitude array
-    Cost = cost function, used for testing satisfactory convergence.
+    lat_s = Optimised latitude array
+    lon_s = optimised longitude array
+    Cost = cost function at the optimised track.
     """
 
     if len(lat) <= 5:
         return lat, lon, 0.0 # Polite return of data too short to smooth.
 
-    lat_s = np.ma.copy(lat)
-    lon_s = np.ma.copy(lon)
-
-    # Set up a weighted array that will slide past the data.
-    r = 0.7
-    # Values of r alter the speed to converge; 0.7 seems best.
-    slider = np.ma.ones(5)*r/4
-    slider[2] = 1-r
-
-    cost_0 = float('inf')
-    cost = smooth_track_cost_function(lat_s, lon_s, lat, lon, ac_type, hz)
-
-    while cost < cost_0:  # Iterate to an optimal solution.
-        lat_last = np.ma.copy(lat_s)
-        lon_last = np.ma.copy(lon_s)
-
-        # Straighten out the middle of the arrays, leaving the ends unchanged.
-        lat_s.data[2:-2] = np.convolve(lat_last,slider,'valid')
-        lon_s.data[2:-2] = np.convolve(lon_last,slider,'valid')
-
-        cost_0 = cost
-        cost = smooth_track_cost_function(lat_s, lon_s, lat, lon, ac_type, hz)
-
-    if cost>0.1:
-        logger.warning("Smooth Track Cost Function closed with cost %f.3",cost)
+    # Solve on the plain data; the masks are only needed to exclude masked
+    # samples from the data error and are restored on the result.
+    lat_data = np.ma.getdata(lat)
+    lon_data = np.ma.getdata(lon)
+    lat_valid = ~np.ma.getmaskarray(lat)
+    lon_valid = ~np.ma.getmaskarray(lon)
+    weight = _smooth_track_weight(ac_type, hz)
+
+    if np.array_equal(lat_valid, lon_valid):
+        # Both coordinates share the system matrix, so solve them together.
+        lat_s, lon_s = _smooth_track_solve(
+            np.column_stack((lat_data, lon_data)), lat_valid, weight).T
+    else:
+        lat_s = _smooth_track_solve(lat_data, lat_valid, weight)
+        lon_s = _smooth_track_solve(lon_data, lon_valid, weight)
+    cost = _smooth_track_cost(lat_s, lon_s, lat_data, lon_data, lat_valid,
+                              lon_valid, weight)
 
-    return lat_last, lon_last, cost_0
+    return (np.ma.array(lat_s, mask=np.ma.getmask(lat), copy=True),
+            np.ma.array(lon_s, mask=np.ma.getmask(lon), copy=True),
+            cost)
 
 def straighten_altitudes(fine_array, coarse_array, limit, copy=False):
     '''
@@ -7941,6 +8049,82 @@ def vstack_params_sw(window, *params):
     return vstack_params_filtered(window, *params, method='second_window')
 
 
+def _reduce_stacked(data, mask, method):
+    '''
+    Reduce a stack of plain arrays over the first axis, skipping samples
+    flagged in the matching boolean mask.
+
+    Masked samples are overwritten in data so that the reduction runs over
+    the whole block without allocating a second array of the same size.
+
+    :param data: Stacked float parameter data of shape (n, samples). Modified
+        in place.
+    :type data: np.ndarray
+    :param mask: Boolean mask of the same shape as data.
+    :type mask: np.ndarray
+    :param method: Reduction to apply, one of 'average', 'max' or 'min'.
+    :type method: str
+    :returns: Reduced data and mask, masked where every row is masked.
+    :rtype: (np.ndarray, np.ndarray)
+    '''
+    if method == 'average':
+        np.putmask(data, mask, 0.0)
+        count = len(data) - mask.sum(axis=0)
+        array = data.sum(axis=0) / np.maximum(count, 1)
+        return array, count == 0
+    elif method == 'max':
+        np.putmask(data, mask, -np.inf)
+        array = data.max(axis=0)
+    elif method == 'min':
+        np.putmask(data, mask, np.inf)
+        array = data.min(axis=0)
+    else:
+        raise ValueError("Unsupported reduction method '%s'" % method)
+    return array, mask.all(axis=0)
+
+
+def vstack_params_reduce(method, *params):
+    '''
+    Reduce the stacked parameters sample by sample, ignoring masked values.
+
+    The data and masks of the parameters are stacked into separate plain
+    arrays and reduced without masked array operations; the result is only
+    wrapped as a masked array once at the end.
+
+    :param method: Reduction to apply, one of 'average', 'max' or 'min'.
+    :type method: str
+    :param params: Parameter arguments as required. Allows some None values.
+    :type params: np.ma.array or Parameter object or None
+    :returns: Reduced array, masked where all params are masked.
+    :rtype: np.ma.array
+    :raises: ValueError if method is not supported or all params are None
+    '''
+    arrays = [getattr(p, 'array', p) for p in params if p is not None]
+    if not arrays:
+        raise ValueError('vstack_params_reduce requires at least one param')
+    if method == 'average' and len(arrays) == 2:
+        # Two engines are averaged directly, weighting each by whether it is
+        # valid, without stacking the arrays.
+        # getmask returns the scalar nomask for unmasked arrays, which
+        # broadcasts below without allocating a boolean array.
+        valid_a = ~np.ma.getmask(arrays[0])
+        valid_b = ~np.ma.getmask(arrays[1])
+        count = valid_a.astype(np.int8) + valid_b
+        total = (np.where(valid_a, np.ma.getdata(arrays[0]), 0.0) +
+                 np.where(valid_b, np.ma.getdata(arrays[1]), 0.0))
+        return np.ma.array(total / np.maximum(count, 1), mask=count == 0)
+    # Fill one contiguous (n, samples) block each for data and mask rather
+    # than stacking per-parameter copies.
+    shape = (len(arrays), len(arrays[0]))
+    data = np.empty(shape, dtype=np.float64)
+    mask = np.empty(shape, dtype=bool)
+    for row, a in enumerate(arrays):
+        data[row] = np.ma.getdata(a)
+        mask[row] = np.ma.getmask(a)
+    array, array_mask = _reduce_stacked(data, mask, method)
+    return np.ma.array(array, mask=array_mask)
+
+
 def vstack_params_where_state(*param_states):
     '''
     Create a multi-dimensional masked array with a dimension for each param,
@@ -8148,7 +8332,13 @@ def dp_over_p2mach(dp_over_p):
     """
     Return the mach number for a given delta p over p. Supersonic results masked as invalid.
     """
-    mach_squared = 5.0 * ((dp_over_p + 1.0) ** (2.0/7.0) - 1.0)
+    # Work through a single float copy in place rather than allocating a
+    # temporary for each step of the formula.
+    mach_squared = np.ma.array(dp_over_p, dtype=np.float64, copy=True)
+    mach_squared += 1.0
+    mach_squared **= 2.0/7.0
+    mach_squared -= 1.0
+    mach_squared *= 5.0
     mach = np.ma.sqrt(mach_squared)
     return np.ma.masked_greater_equal(mach, 1.0)
 
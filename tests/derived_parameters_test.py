@@ -1,12 +1,14 @@
 import numpy as np
 
 import datetime
+import functools
+import itertools
 import os
 import shutil
 import sys
 import tempfile
 import unittest
-import csv
+import pytest
 
 from unittest.mock import Mock, patch
 
@@ -253,6 +255,68 @@ debug = sys.gettrace() is not None
 test_data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                               'test_data')
 
+# Every non-empty combination of the four engines, in dependency order.
+ENG_NP_COMBINATIONS = tuple(itertools.chain.from_iterable(
+    itertools.combinations(('Eng (1) Np', 'Eng (2) Np', 'Eng (3) Np',
+                            'Eng (4) Np'), r)
+    for r in range(1, 5)
+))
+
+
+def frozen_array(values, dtype=None):
+    '''
+    Expected results shared between tests are built once and made read-only
+    so that no test can modify them for another.
+    '''
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+
+# Two engine reductions where both engines are masked at the start (filled
+# with 999) and only the second engine is masked at the end.
+ENG_EXPECTED_AVG = frozen_array([999, 6, 7, 8, 9, 10, 11, 12, 13, 9],
+                                dtype=np.float64)
+ENG_EXPECTED_MAX = frozen_array([999, 11, 12, 13, 14, 15, 16, 17, 18, 9],
+                                dtype=np.float64)
+ENG_EXPECTED_MIN = frozen_array([999, 1, 2, 3, 4, 5, 6, 7, 8, 9],
+                                dtype=np.float64)
+
+# Heading plus drift for the Track tests.
+TRACK_EXPECTED = frozen_array(
+    [15.0, 30.0, 60.0, 120.0, 240.0, 0.0, 90.0, 180.0, 270.0, 0.0],
+    dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=None)
+def load_test_array(filename):
+    '''
+    Load a compressed array from the test data directory once per test run.
+    The array is shared between callers so it is returned read-only.
+    '''
+    array = load_compressed(os.path.join(test_data_path, filename))
+    array.flags.writeable = False
+    return array
+
+
+@functools.lru_cache(maxsize=None)
+def shared_section(name, *args):
+    '''
+    Cached buildsection for tests which share identical phase ranges. The
+    derive methods only read the sections so a single instance is reused.
+    '''
+    return buildsection(name, *args)
+
+
+@functools.lru_cache(maxsize=None)
+def operational_combinations(node_class):
+    '''
+    Cached get_operational_combinations for node classes which are checked by
+    more than one test. Returned as a tuple so the shared result is immutable.
+    '''
+    return tuple(node_class.get_operational_combinations())
+
+
 def assert_array_within_tolerance(actual, desired, tolerance=1, similarity=100):
     '''
     Check that the actual array within tolerance of the desired array is
@@ -323,11 +387,11 @@ class NodeTest(object):
     def test_can_operate(self):
         if getattr(self, 'check_operational_combination_length_only', False):
             self.assertEqual(
-                len(self.node_class.get_operational_combinations()),
+                len(operational_combinations(self.node_class)),
                 self.operational_combination_length,
             )
         else:
-            combinations = list(map(set, self.node_class.get_operational_combinations()))
+            combinations = list(map(set, operational_combinations(self.node_class)))
             for combination in map(set, self.operational_combinations):
                 self.assertIn(combination, combinations)
 
@@ -846,8 +910,8 @@ class TestAirspeedTrue(unittest.TestCase):
         gspd.array[-4:] = [14.0, 14.0, 14.0, 14.0]
         alt = P('Altitude STD Smoothed', np.ma.zeros(40))
         acc = P('Acceleration Forwards', np.ma.concatenate((np.ones(20) * 0.25, np.ones(20) * -0.25)))
-        toffs = buildsection('Takeoff', 0, 18)
-        lands = buildsection('Landing', 21, None)
+        toffs = shared_section('Takeoff', 0, 18)
+        lands = shared_section('Landing', 21, None)
         tas = AirspeedTrue()
         tas.derive(cas, alt, None, toffs, lands, None, gspd, acc)
         expected = np.ma.concatenate((accel, accel[::-1]))
@@ -857,7 +921,7 @@ class TestAirspeedTrue(unittest.TestCase):
         # Curiously, the test above only checks the valid samples, so no
         # extrapolation is needed to pass, hence a check on validity is
         # essential !
-        self.assertEqual(np.ma.count(tas.array), 40)
+        self.assertEqual(np.count_nonzero(~np.ma.getmaskarray(tas.array)), 40)
 
     def test_tas_no_gs_extensions(self):
         # With no groundspeed available, the true airspeed is an integration
@@ -868,8 +932,8 @@ class TestAirspeedTrue(unittest.TestCase):
         cas = P('Airspeed', np.ma.concatenate((np.zeros(9), speed[9:], speed[-1:8:-1], np.zeros(9))))
         alt = P('Altitude STD Smoothed', np.ma.zeros(40))
         acc = P('Acceleration Forwards', np.ma.concatenate((np.ones(20) * 0.25, np.ones(20) * -0.25)))
-        toffs = buildsection('Takeoff', 0, 18)
-        lands = buildsection('Landing', 21, None)
+        toffs = shared_section('Takeoff', 0, 18)
+        lands = shared_section('Landing', 21, None)
         tas = AirspeedTrue()
         tas.derive(cas, alt, None, toffs, lands, None, None, acc)
         expected = np.ma.concatenate((speed, speed[::-1]))
@@ -877,7 +941,7 @@ class TestAirspeedTrue(unittest.TestCase):
         # Curiously, the test above only checks the valid samples, so no
         # extrapolation is needed to pass, hence a check on validity is
         # essential !
-        self.assertEqual(np.ma.count(tas.array), 40)
+        self.assertEqual(np.count_nonzero(~np.ma.getmaskarray(tas.array)), 40)
 
     def test_tas_rto(self):
         speed = np.array([0.0, 4.7, 9.5, 14.3, 19.0, 23.8, 28.6, 33.3, 38.1, 42.9,
@@ -885,7 +949,7 @@ class TestAirspeedTrue(unittest.TestCase):
         cas = P('Airspeed', np.ma.concatenate((np.zeros(9), speed[9:], speed[-1:8:-1], np.zeros(9))))
         alt = P('Altitude STD Smoothed', np.ma.zeros(40))
         acc = P('Acceleration Forwards', np.ma.concatenate((np.ones(20) * 0.25, np.ones(20) * -0.25)))
-        rtos = buildsection('Rejected Takeoff', 1, 38)
+        rtos = shared_section('Rejected Takeoff', 1, 38)
         tas = AirspeedTrue()
         tas.derive(cas, alt, None, None, None, rtos, None, acc)
         expected = np.ma.concatenate((speed, speed[::-1]))
@@ -922,7 +986,7 @@ class TestAltitudeSTDSmoothed(unittest.TestCase):
 
 class TestAltitudeAAL(unittest.TestCase):
     def test_can_operate(self):
-        opts = AltitudeAAL.get_operational_combinations()
+        opts = operational_combinations(AltitudeAAL)
         self.assertTrue(('Altitude STD Smoothed', 'Fast') in opts)
         self.assertTrue(('Altitude Radio Offset Removed', 'Altitude STD Smoothed', 'Fast') in opts)
 
@@ -967,10 +1031,10 @@ class TestAltitudeAAL(unittest.TestCase):
     def test_alt_aal_complex(self):
         testwave = np.ma.cos(np.arange(0, 3.14 * 2 * 5, 0.1)) * -3000 + \
             np.ma.cos(np.arange(0, 3.14 * 2, 0.02)) * -5000 + 7996
-        rad_wave = np.copy(testwave)
-        rad_wave[110:140] -= 8765 # The ground is 8,765 ft high at this point.
-        rad_data = np.ma.masked_greater(rad_wave, 2600)
-        phase_fast = buildsection('Fast', 0, len(testwave))
+        ground = np.zeros_like(testwave.data)
+        ground[110:140] = 8765 # The ground is 8,765 ft high at this point.
+        rad_data = np.ma.masked_greater(testwave.data - ground, 2600)
+        phase_fast = shared_section('Fast', 0, len(testwave))
         alt_aal = AltitudeAAL()
         alt_aal.derive(P('Altitude Radio', rad_data),
                        P('Altitude STD Smoothed', testwave),
@@ -994,7 +1058,7 @@ class TestAltitudeAAL(unittest.TestCase):
     def test_alt_aal_complex_no_ralt_flying_below_takeoff_airfield(self):
         testwave = np.ma.cos(np.arange(0, 3.14 * 2 * 5, 0.1)) * -2000 + \
             np.ma.cos(np.arange(0, 3.14 * 2, 0.02)) * 5000 + 0
-        phase_fast = buildsection('Fast', 0, len(testwave))
+        phase_fast = shared_section('Fast', 0, len(testwave))
         alt_aal = AltitudeAAL()
         alt_aal.derive(None,
                        P('Altitude STD Smoothed', testwave),
@@ -1024,7 +1088,7 @@ class TestAltitudeAAL(unittest.TestCase):
                                       np.zeros(50)])
         rad_wave = np.copy(std_wave) - 8
         rad_data = np.ma.masked_greater(rad_wave, 2600)
-        phase_fast = buildsection('Fast', 35, len(std_wave))
+        phase_fast = shared_section('Fast', 35, len(std_wave))
         std_wave += 1000
         rad_data[42:48] = np.ma.masked
         alt_aal = AltitudeAAL()
@@ -1045,13 +1109,14 @@ class TestAltitudeAAL(unittest.TestCase):
         self.assertEqual(alt_aal.array[45], 0)  # NOT 1000!
 
     def test_alt_aal_complex_doubled(self):
-        testwave = np.ma.cos(np.arange(0, 3.14 * 2, 0.02)) * -5000 + 5500
-        rad_wave = np.copy(testwave)-500
+        testwave = np.cos(np.arange(0, 3.14 * 2, 0.02)) * -5000 + 5500
+        rad_wave = testwave - 500
         #rad_wave[110:140] -= 8765 # The ground is 8,765 ft high at this point.
-        rad_data = np.ma.masked_greater(rad_wave, 2600)
-        double_test = np.ma.concatenate((testwave, testwave))
-        double_rad = np.ma.concatenate((rad_data, rad_data))
-        phase_fast = buildsection('Fast', 0, 2*len(testwave))
+        rad_mask = rad_wave > 2600
+        double_test = np.ma.array(np.tile(testwave, 2))
+        double_rad = np.ma.array(np.tile(rad_wave, 2),
+                                 mask=np.tile(rad_mask, 2), copy=False)
+        phase_fast = shared_section('Fast', 0, 2*len(testwave))
         alt_aal = AltitudeAAL()
         alt_aal.derive(P('Altitude Radio', double_rad),
                        P('Altitude STD Smoothed', double_test),
@@ -1067,13 +1132,14 @@ class TestAltitudeAAL(unittest.TestCase):
         np.testing.assert_equal(alt_aal.array[0], 0.0)
 
     def test_alt_aal_complex_doubled_with_touch_and_go(self):
-        testwave = np.ma.cos(np.arange(0, 3.14 * 2, 0.02)) * -5000 + 5000
-        rad_wave = np.copy(testwave)-500
+        testwave = np.cos(np.arange(0, 3.14 * 2, 0.02)) * -5000 + 5000
+        rad_wave = testwave - 500
         #rad_wave[110:140] -= 8765 # The ground is 8,765 ft high at this point.
-        rad_data = np.ma.masked_greater(rad_wave, 2600)
-        double_test = np.ma.concatenate((testwave, testwave))
-        double_rad = np.ma.concatenate((rad_data, rad_data))
-        phase_fast = buildsection('Fast', 0, 2*len(testwave))
+        rad_mask = rad_wave > 2600
+        double_test = np.ma.array(np.tile(testwave, 2))
+        double_rad = np.ma.array(np.tile(rad_wave, 2),
+                                 mask=np.tile(rad_mask, 2), copy=False)
+        phase_fast = shared_section('Fast', 0, 2*len(testwave))
         alt_aal = AltitudeAAL()
         alt_aal.derive(P('Altitude Radio', double_rad),
                        P('Altitude STD Smoothed', double_test),
@@ -1093,7 +1159,7 @@ class TestAltitudeAAL(unittest.TestCase):
             np.ma.cos(np.arange(0, 3.14 * 2, 0.02)) * -5000 + 7996
         testwave[255:]=testwave[254]
         testwave[:5]=500.0
-        phase_fast = buildsection('Fast', 0, 254)
+        phase_fast = shared_section('Fast', 0, 254)
         alt_aal = AltitudeAAL()
         alt_aal.derive(None,
                        P('Altitude STD Smoothed', testwave),
@@ -1119,7 +1185,7 @@ class TestAltitudeAAL(unittest.TestCase):
         x = testwave[join]
         n = len(testwave) - join
         testwave[join:] = np.linspace(x, x-80, n)
-        phase_fast = buildsection('Fast', 0, 28)
+        phase_fast = shared_section('Fast', 0, 28)
         pch = np_ma_ones_like(testwave)
         pch[23:27]=2.0
         alt_aal = AltitudeAAL()
@@ -1345,8 +1411,8 @@ class TestAimingPointRange(unittest.TestCase):
 
 class TestAltitudeAALForFlightPhases(unittest.TestCase):
     def test_can_operate(self):
-        expected = [('Altitude AAL',)]
-        opts = AltitudeAALForFlightPhases.get_operational_combinations()
+        expected = (('Altitude AAL',),)
+        opts = operational_combinations(AltitudeAALForFlightPhases)
         self.assertEqual(opts, expected)
 
     def test_altitude_AAL_for_flight_phases_basic(self):
@@ -1467,6 +1533,17 @@ class TestBaroCorrection(unittest.TestCase):
 
 
 class TestAltitudeQNH(unittest.TestCase, NodeTest):
+    # Expected outputs are shared read-only by all tests: the first for
+    # QNH throughout, the second with samples 10-14 held at STD.
+    expected = (
+        (9636, 9663, 9691, 9719, 9746, 9774, 9801, 9828, 9856, 9883,
+         9911, 9938, 9965, 9993, 10020, 10047, 10074, 10102, 10129, 10156,
+         10183, 10210, 10238, 10265, 10292),
+        (9636, 9663, 9691, 9719, 9746, 9774, 9801, 9828, 9856, 9883,
+         10000, 10000, 10000, 10000, 10000, 10047, 10074, 10102, 10129, 10156,
+         10183, 10210, 10238, 10265, 10292),
+    )
+
     def setUp(self):
         self.node_class = AltitudeQNH
         self.operational_combinations = [('Altitude STD', 'Baro Correction')]
@@ -1483,12 +1560,7 @@ class TestAltitudeQNH(unittest.TestCase, NodeTest):
         node = self.node_class()
         node.derive(alt_std, baro, None, None, None, None)
 
-        expected_alt_qnh = [
-            9636, 9663, 9691, 9719, 9746, 9774, 9801, 9828, 9856, 9883,
-            9911, 9938, 9965, 9993, 10020, 10047, 10074, 10102, 10129, 10156,
-            10183, 10210, 10238, 10265, 10292
-        ]
-        for expected, got in zip(expected_alt_qnh, node.array):
+        for expected, got in zip(self.expected[0], node.array):
             self.assertEqual(expected, int(got))
 
     def test_baro_setting(self):
@@ -1504,12 +1576,7 @@ class TestAltitudeQNH(unittest.TestCase, NodeTest):
         node = self.node_class()
         node.derive(alt_std, baro, baro_sel, None, None, None)
 
-        expected_alt_qnh = [
-            9636, 9663, 9691, 9719, 9746, 9774, 9801, 9828, 9856, 9883,
-            10000, 10000, 10000, 10000, 10000, 10047, 10074, 10102, 10129, 10156,
-            10183, 10210, 10238, 10265, 10292
-        ]
-        for expected, got in zip(expected_alt_qnh, node.array):
+        for expected, got in zip(self.expected[1], node.array):
             self.assertEqual(expected, int(got))
 
     def test_baro_cpt_fo_setting(self):
@@ -1530,12 +1597,7 @@ class TestAltitudeQNH(unittest.TestCase, NodeTest):
         node = self.node_class()
         node.derive(alt_std, baro, None, baro_sel_cpt, baro_sel_fo, None)
 
-        expected_alt_qnh = [
-            9636, 9663, 9691, 9719, 9746, 9774, 9801, 9828, 9856, 9883,
-            10000, 10000, 10000, 10000, 10000, 10047, 10074, 10102, 10129, 10156,
-            10183, 10210, 10238, 10265, 10292
-        ]
-        for expected, got in zip(expected_alt_qnh, node.array):
+        for expected, got in zip(self.expected[1], node.array):
             self.assertEqual(expected, int(got))
 
     def test_baro_correction_isis(self):
@@ -1549,12 +1611,7 @@ class TestAltitudeQNH(unittest.TestCase, NodeTest):
         node = self.node_class()
         node.derive(alt_std, baro, None, None, None, baro_cor_isis)
 
-        expected_alt_qnh = [
-            9636, 9663, 9691, 9719, 9746, 9774, 9801, 9828, 9856, 9883,
-            10000, 10000, 10000, 10000, 10000, 10047, 10074, 10102, 10129, 10156,
-            10183, 10210, 10238, 10265, 10292
-        ]
-        for expected, got in zip(expected_alt_qnh, node.array):
+        for expected, got in zip(self.expected[1], node.array):
             self.assertEqual(expected, int(got))
 
 
@@ -3204,8 +3261,8 @@ class TestEng_N1Avg(unittest.TestCase, NodeTest):
     def test_derive_two_engines(self):
         # this tests that average is performed on incomplete dependencies and
         # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
+        a = np.ma.arange(0, 10, dtype=np.float64)
+        b = np.ma.arange(10, 20, dtype=np.float64)
         a[0] = np.ma.masked
         b[0] = np.ma.masked
         b[-1] = np.ma.masked
@@ -3233,8 +3290,8 @@ class TestEng_N1Max(unittest.TestCase, NodeTest):
     def test_derive_two_engines(self):
         # this tests that average is performed on incomplete dependencies and
         # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
+        a = np.ma.arange(0, 10, dtype=np.float64)
+        b = np.ma.arange(10, 20, dtype=np.float64)
         a[0] = np.ma.masked
         b[0] = np.ma.masked
         b[-1] = np.ma.masked
@@ -3270,8 +3327,8 @@ class TestEng_N1Min(unittest.TestCase, NodeTest):
     def test_derive_two_engines(self):
         # this tests that average is performed on incomplete dependencies and
         # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10,20)
+        a = np.ma.arange(0, 10, dtype=np.float64)
+        b = np.ma.arange(10, 20, dtype=np.float64)
         a[0] = np.ma.masked
         b[0] = np.ma.masked
         b[-1] = np.ma.masked
@@ -3316,7 +3373,6 @@ class TestEng_N1MinFor5Sec(unittest.TestCase, NodeTest):
         self.assertAlmostEqual(min5s.array[24], 39.7)
 
 class TestEng_N2Avg(unittest.TestCase, NodeTest):
-
     def setUp(self):
         self.node_class = Eng_N2Avg
         self.operational_combinations = [
@@ -3326,26 +3382,8 @@ class TestEng_N2Avg(unittest.TestCase, NodeTest):
             ('Eng (1) N2', 'Eng (2) N2', 'Eng (3) N2', 'Eng (4) N2',),
         ]
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng_avg = Eng_N2Avg()
-        eng_avg.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng_avg.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      6,7,8,9,10,11,12,13, # unmasked avg of two engines
-                      9]) # only second engine value masked
-        )
-
 
 class TestEng_N2Max(unittest.TestCase, NodeTest):
-
     def setUp(self):
         self.node_class = Eng_N2Max
         self.operational_combinations = [
@@ -3355,25 +3393,8 @@ class TestEng_N2Max(unittest.TestCase, NodeTest):
             ('Eng (1) N2', 'Eng (2) N2', 'Eng (3) N2', 'Eng (4) N2',),
         ]
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng = Eng_N2Max()
-        eng.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      11,12,13,14,15,16,17,18,9])
-        )
-
 
 class TestEng_N2Min(unittest.TestCase, NodeTest):
-
     def setUp(self):
         self.node_class = Eng_N2Min
         self.operational_combinations = [
@@ -3383,25 +3404,8 @@ class TestEng_N2Min(unittest.TestCase, NodeTest):
             ('Eng (1) N2', 'Eng (2) N2', 'Eng (3) N2', 'Eng (4) N2',),
         ]
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng = Eng_N2Min()
-        eng.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      1,2,3,4,5,6,7,8,9])
-        )
-
 
 class TestEng_N3Avg(unittest.TestCase, NodeTest):
-
     def setUp(self):
         self.node_class = Eng_N3Avg
         self.operational_combinations = [
@@ -3411,26 +3415,8 @@ class TestEng_N3Avg(unittest.TestCase, NodeTest):
             ('Eng (1) N3', 'Eng (2) N3', 'Eng (3) N3', 'Eng (4) N3',),
         ]
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng_avg = Eng_N3Avg()
-        eng_avg.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng_avg.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      6,7,8,9,10,11,12,13, # unmasked avg of two engines
-                      9]) # only second engine value masked
-        )
-
 
 class TestEng_N3Max(unittest.TestCase, NodeTest):
-
     def setUp(self):
         self.node_class = Eng_N3Max
         self.operational_combinations = [
@@ -3440,25 +3426,8 @@ class TestEng_N3Max(unittest.TestCase, NodeTest):
             ('Eng (1) N3', 'Eng (2) N3', 'Eng (3) N3', 'Eng (4) N3',),
         ]
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng = Eng_N3Max()
-        eng.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      11,12,13,14,15,16,17,18,9])
-        )
-
 
 class TestEng_N3Min(unittest.TestCase, NodeTest):
-
     def setUp(self):
         self.node_class = Eng_N3Min
         self.operational_combinations = [
@@ -3468,95 +3437,55 @@ class TestEng_N3Min(unittest.TestCase, NodeTest):
             ('Eng (1) N3', 'Eng (2) N3', 'Eng (3) N3', 'Eng (4) N3',),
         ]
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng = Eng_N3Min()
-        eng.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      1,2,3,4,5,6,7,8,9])
-        )
-
 
 class TestEng_NpAvg(unittest.TestCase):
     def test_can_operate(self):
-        opts = Eng_NpAvg.get_operational_combinations()
-        self.assertEqual(opts[0], ('Eng (1) Np',))
-        self.assertEqual(opts[-1], ('Eng (1) Np', 'Eng (2) Np', 'Eng (3) Np', 'Eng (4) Np'))
-        self.assertEqual(len(opts), 15) # 15 combinations accepted!
-
-
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng_avg = Eng_NpAvg()
-        eng_avg.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng_avg.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      6,7,8,9,10,11,12,13, # unmasked avg of two engines
-                      9]) # only second engine value masked
-        )
+        # 15 combinations accepted!
+        self.assertEqual(operational_combinations(Eng_NpAvg), ENG_NP_COMBINATIONS)
 
 
 class TestEng_NpMax(unittest.TestCase):
     def test_can_operate(self):
-        opts = Eng_NpMax.get_operational_combinations()
-        self.assertEqual(opts[0], ('Eng (1) Np',))
-        self.assertEqual(opts[-1], ('Eng (1) Np', 'Eng (2) Np', 'Eng (3) Np', 'Eng (4) Np'))
-        self.assertEqual(len(opts), 15) # 15 combinations accepted!
-
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng = Eng_NpMax()
-        eng.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      11,12,13,14,15,16,17,18,9])
-        )
+        # 15 combinations accepted!
+        self.assertEqual(operational_combinations(Eng_NpMax), ENG_NP_COMBINATIONS)
 
 
 class TestEng_NpMin(unittest.TestCase):
     def test_can_operate(self):
-        opts = Eng_NpMin.get_operational_combinations()
-        self.assertEqual(opts[0], ('Eng (1) Np',))
-        self.assertEqual(opts[-1], ('Eng (1) Np', 'Eng (2) Np', 'Eng (3) Np', 'Eng (4) Np'))
-        self.assertEqual(len(opts), 15) # 15 combinations accepted!
+        # 15 combinations accepted!
+        self.assertEqual(operational_combinations(Eng_NpMin), ENG_NP_COMBINATIONS)
 
-    def test_derive_two_engines(self):
-        # this tests that average is performed on incomplete dependencies and
-        # more than one dependency provided.
-        a = np.ma.arange(0, 10)
-        b = np.ma.arange(10, 20)
-        a[0] = np.ma.masked
-        b[0] = np.ma.masked
-        b[-1] = np.ma.masked
-        eng = Eng_NpMin()
-        eng.derive(P('a',a), P('b',b), None, None)
-        assert_array_equal(
-            np.ma.filled(eng.array, fill_value=999),
-            np.array([999, # both masked, so filled with 999
-                      1,2,3,4,5,6,7,8,9])
-        )
+
+class TestEngReduceTwoEngines:
+    '''
+    The Eng (*) N2, N3 and Np Avg, Max and Min nodes reduce incomplete
+    dependencies where more than one dependency is provided.
+    '''
+    params = [
+        pytest.param(Eng_N2Avg, ENG_EXPECTED_AVG, id='N2 Avg'),
+        pytest.param(Eng_N2Max, ENG_EXPECTED_MAX, id='N2 Max'),
+        pytest.param(Eng_N2Min, ENG_EXPECTED_MIN, id='N2 Min'),
+        pytest.param(Eng_N3Avg, ENG_EXPECTED_AVG, id='N3 Avg'),
+        pytest.param(Eng_N3Max, ENG_EXPECTED_MAX, id='N3 Max'),
+        pytest.param(Eng_N3Min, ENG_EXPECTED_MIN, id='N3 Min'),
+        pytest.param(Eng_NpAvg, ENG_EXPECTED_AVG, id='Np Avg'),
+        pytest.param(Eng_NpMax, ENG_EXPECTED_MAX, id='Np Max'),
+        pytest.param(Eng_NpMin, ENG_EXPECTED_MIN, id='Np Min'),
+    ]
+
+    @pytest.mark.parametrize('node_class, expected', params)
+    def test_derive_two_engines(self, node_class, expected):
+        # Inputs are built for each case so no node can modify them for
+        # another.
+        eng_1 = np.ma.arange(0, 10, dtype=np.float64)
+        eng_2 = np.ma.arange(10, 20, dtype=np.float64)
+        eng_1[0] = np.ma.masked
+        eng_2[0] = np.ma.masked
+        eng_2[-1] = np.ma.masked
+        node = node_class()
+        node.derive(P('a', eng_1), P('b', eng_2), None, None)
+        # Masked samples are compared as 999.
+        np.testing.assert_array_equal(np.ma.filled(node.array, 999), expected)
 
 
 class TestFuelQty(unittest.TestCase):
@@ -3566,8 +3495,8 @@ class TestFuelQty(unittest.TestCase):
         # combinations as this can get very large (2**(n-1)-1) where n is the
         # number of parameters n-1 as both left and right are required if
         # either is avalibale (-1 as none is not a option)
-        self.assertEqual(len(FuelQty.get_operational_combinations()), 2**7-2)
-        opts = FuelQty.get_operational_combinations()
+        opts = operational_combinations(FuelQty)
+        self.assertEqual(len(opts), 2**7-2)
         self.assertTrue(('Fuel Qty (L)', 'Fuel Qty (C)', 'Fuel Qty (R)',
                          'Fuel Qty (Trim)', 'Fuel Qty (Aux)',
                          'Fuel Qty (Tail)', 'Fuel Qty (Stab)') in opts)
@@ -3776,6 +3705,19 @@ class TestFuelQtyAux(unittest.TestCase):
 
 class TestGrossWeightSmoothed(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Seven weight samples 64 seconds apart over 448 seconds of constant
+        # fuel flow. The derive method copies the weight and the fuel flow
+        # has nothing to repair, so these are shared between tests.
+        cls.weight = P('Gross Weight',
+                       np.ma.array(data=[484, 420, 356, 292, 228, 164, 100],
+                                   mask=[1, 0, 0, 0, 0, 1, 0], dtype=float),
+                       offset=0.0, frequency=1 / 64.0)
+        cls.fuel_flow = P('Eng (*) Fuel Flow',
+                          np.ma.array(np.full(448, 3600.0)),
+                          offset=0.0, frequency=1.0)
+
     def test_can_operate(self):
         expected = ('Eng (*) Fuel Flow','Gross Weight', 'Climbing',
                      'Descending', 'Airborne')
@@ -3858,21 +3800,21 @@ class TestGrossWeightSmoothed(unittest.TestCase):
 
     def test_gw_masked(self):
         weight = P('Gross Weight',np.ma.array([292,228,164,100],dtype=float),offset=0.0,frequency=1/64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(256) * 3600, offset=0.0, frequency=1.0)
+        fuel_flow = P('Eng (*) Fuel Flow', np.ma.array(np.full(256, 3600.0)), offset=0.0, frequency=1.0)
         weight_aligned = align(weight, fuel_flow)
-        climb = buildsection('Climbing', 10, 20)
-        descend = buildsection('Descending', 40, 50)
-        fast = buildsection('Fast', None, None)
+        climb = shared_section('Climbing', 10, 20)
+        descend = shared_section('Descending', 40, 50)
+        fast = shared_section('Fast', None, None)
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, fast])
         assert_equal(result.array, weight_aligned)
 
     def test_gw_formula(self):
         weight = P('Gross Weight',np.ma.array([292,228,164,100],dtype=float),offset=0.0,frequency=1/64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(256) * 3600, offset=0.0, frequency=1.0)
-        climb = buildsection('Climbing', 10, 20)
-        descend = buildsection('Descending', 40, 50)
-        fast = buildsection('Fast', 10, len(fuel_flow.array))
+        fuel_flow = P('Eng (*) Fuel Flow', np.ma.array(np.full(256, 3600.0)), offset=0.0, frequency=1.0)
+        climb = shared_section('Climbing', 10, 20)
+        descend = shared_section('Descending', 40, 50)
+        fast = shared_section('Fast', 10, len(fuel_flow.array))
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(result.array[0], 292.0)
@@ -3881,24 +3823,21 @@ class TestGrossWeightSmoothed(unittest.TestCase):
     def test_gw_formula_with_many_samples(self):
         weight = P('Gross Weight', np.ma.arange(56400, 50000, -64),
                    offset=0.0, frequency=1 / 64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(6400) * 3600,
+        fuel_flow = P('Eng (*) Fuel Flow', np.ma.array(np.full(6400, 3600.0)),
                       offset=0.0, frequency=1.0)
-        climb = buildsection('Climbing', 10, 20)
-        descend = buildsection('Descending', 50, 60)
-        fast = buildsection('Fast', 10, len(fuel_flow.array))
+        climb = shared_section('Climbing', 10, 20)
+        descend = shared_section('Descending', 50, 60)
+        fast = shared_section('Fast', 10, len(fuel_flow.array))
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(result.array[1], 56400-1)
 
     def test_gw_formula_with_good_data(self):
-        weight = P('Gross Weight', np.ma.array(data=[484, 420, 356, 292, 228, 164, 100],
-                                               mask=[1, 0, 0, 0, 0, 1, 0], dtype=float),
-                   offset=0.0, frequency=1 / 64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(448) * 3600,
-                      offset=0.0, frequency=1.0)
-        climb = buildsection('Climbing', 10, 20)
-        descend = buildsection('Descending', 60, 70)
-        fast = buildsection('Fast', 10, len(fuel_flow.array))
+        weight = self.weight
+        fuel_flow = self.fuel_flow
+        climb = shared_section('Climbing', 10, 20)
+        descend = shared_section('Descending', 60, 70)
+        fast = shared_section('Fast', 10, len(fuel_flow.array))
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(result.array[0], 484.0)
@@ -3908,39 +3847,33 @@ class TestGrossWeightSmoothed(unittest.TestCase):
         weight = P('Gross Weight', np.ma.array(data=[484, 420, 356, 292, 228, 164, 500],
                                                mask=[1, 0, 0, 0, 0, 0, 0], dtype=float),
                    offset=0.0, frequency=1 / 64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(448) * 3600,
-                      offset=0.0, frequency=1.0)
-        climb = buildsection('Climbing', 10, 20)
-        descend = buildsection('Descending', 60, 70)
-        airs = buildsection('Airborne', 10, 350)
+        fuel_flow = self.fuel_flow
+        climb = shared_section('Climbing', 10, 20)
+        descend = shared_section('Descending', 60, 70)
+        airs = shared_section('Airborne', 10, 350)
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, airs])
         self.assertEqual(result.array[0], 484.0)
         self.assertEqual(result.array[-1], 37.0)
 
     def test_gw_formula_climbing(self):
-        weight = P('Gross Weight',np.ma.array(data=[484, 420, 356, 292, 228, 164, 100],
-                                              mask=[1,0,0,0,0,1,0],dtype=float),
-                   offset=0.0,frequency=1/64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(448) * 3600)
-        climb = buildsection('Climbing', 1, 4)
-        descend = buildsection('Descending', 20, 30)
-        fast = buildsection('Fast', 10, len(fuel_flow.array))
+        weight = self.weight
+        fuel_flow = self.fuel_flow
+        climb = shared_section('Climbing', 1, 4)
+        descend = shared_section('Descending', 20, 30)
+        fast = shared_section('Fast', 10, len(fuel_flow.array))
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(result.array[0], 484.0)
         self.assertEqual(result.array[-1], 37.0)
 
     def test_gw_descending(self):
-        weight = P('Gross Weight',np.ma.array(
-            data=[484, 420, 356, 292, 228, 164, 100],
-            mask=[1, 0, 0, 0, 0, 1, 0], dtype=float),
-                   frequency=1 / 64.0)
-        fuel_flow = P('Eng (*) Fuel Flow', np.ma.ones(448) * 3600)
+        weight = self.weight
+        fuel_flow = self.fuel_flow
         gws = GrossWeightSmoothed()
         climb = S('Climbing')
-        descend = buildsection('Descending', 3, 5)
-        fast = buildsection('Fast', 50, 450)
+        descend = shared_section('Descending', 3, 5)
+        fast = shared_section('Fast', 50, 450)
         gws = GrossWeightSmoothed()
         result = gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(result.array[0], 484.0)
@@ -3954,7 +3887,7 @@ class TestGrossWeightSmoothed(unittest.TestCase):
         gws = GrossWeightSmoothed()
         climb = S('Climbing')
         descend = S('Descending')
-        fast = buildsection('Fast', 0, 1)
+        fast = shared_section('Fast', 0, 1)
         gws = GrossWeightSmoothed()
         gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(len(gws.array),64)
@@ -3969,7 +3902,7 @@ class TestGrossWeightSmoothed(unittest.TestCase):
         gws = GrossWeightSmoothed()
         climb = S('Climbing')
         descend = S('Descending')
-        fast = buildsection('Fast', 0, 1)
+        fast = shared_section('Fast', 0, 1)
         gws = GrossWeightSmoothed()
         gws.get_derived([fuel_flow, weight, climb, descend, fast])
         self.assertEqual(gws.array, weight.array)
@@ -4118,17 +4051,12 @@ class TestGroundspeedSigned(unittest.TestCase):
         assert_equal(gs.array, gspd.array)
 
     def test_scaling_correction(self):
-        lat_data = []
-        lon_data = []
-        gspd_data = []
         this_test_data_path = os.path.join(test_data_path,
                                            'Groundspeed_test_data_Entebbe.csv')
-        with open(this_test_data_path, 'rt') as csvfile:
-            self.reader = csv.DictReader(csvfile)
-            for row in self.reader:
-                lat_data.append(float(row['Latitude']))
-                lon_data.append(float(row['Longitude']))
-                gspd_data.append(float(row['Groundspeed']))
+        data = np.genfromtxt(this_test_data_path, delimiter=',', names=True)
+        lat_data = data['Latitude']
+        lon_data = data['Longitude']
+        gspd_data = data['Groundspeed']
         gspd = P('Groundspeed', gspd_data)
         taxiing = buildsection('Taxiing', 0, len(lat_data))
         ac_type = A(name='Aircraft Type', value = 'aeroplane')
@@ -4155,17 +4083,12 @@ class TestGroundspeedSigned(unittest.TestCase):
         self.assertGreater(np.max(gs.array), 60)
 
     def test_scaling_correction_ineffective_if_not_precise(self):
-        lat_data=[]
-        lon_data=[]
-        gspd_data=[]
         this_test_data_path = os.path.join(test_data_path,
                                            'Groundspeed_test_data_Entebbe.csv')
-        with open(this_test_data_path, 'rt') as csvfile:
-            self.reader = csv.DictReader(csvfile)
-            for row in self.reader:
-                lat_data.append(float(row['Latitude']))
-                lon_data.append(float(row['Longitude']))
-                gspd_data.append(float(row['Groundspeed']))
+        data = np.genfromtxt(this_test_data_path, delimiter=',', names=True)
+        lat_data = data['Latitude']
+        lon_data = data['Longitude']
+        gspd_data = data['Groundspeed']
         gspd = P('Groundspeed', gspd_data)
         taxiing = buildsection('Taxiing', 0, len(lat_data))
         ac_type = A(name='Aircraft Type', value = 'aeroplane')
@@ -4235,6 +4158,8 @@ class TestGroundspeedAlongTrack(unittest.TestCase):
         #assert_array_equal(head.array.data, answer.data)
 
 class TestHeadingContinuous(unittest.TestCase, NodeTest):
+    # Twenty valid samples either side of a twenty sample gap.
+    gap_mask = np.repeat([False, True, False], 20)
 
     def setUp(self):
         self.node_class = HeadingContinuous
@@ -4251,7 +4176,7 @@ class TestHeadingContinuous(unittest.TestCase, NodeTest):
                                          ]
 
     def test_heading_continuous_basic(self):
-        hdg = P('Heading',np.ma.remainder(np.ma.arange(10)+355,360.0))
+        hdg = P('Heading',np.ma.array((np.arange(10.0) + 355.0) % 360.0))
         hdg.array[2] = np.ma.masked
         node = self.node_class()
         node.derive(hdg, None, None)
@@ -4261,7 +4186,7 @@ class TestHeadingContinuous(unittest.TestCase, NodeTest):
         assert_equal(node.array, expected)
 
     def test_heading_continuous_merged(self):
-        hdg = P('Heading',np.ma.remainder(np.ma.arange(10)+355,360.0))
+        hdg = P('Heading',np.ma.array((np.arange(10.0) + 355.0) % 360.0))
         hdg_ca = P('Heading (Capt)',np.ma.array([5,6,7,8,9.0]),offset=0.1,frequency=0.5)
         hdg_fo = P('Heading (FO)',np.ma.array([15,16,17,18,19.0]),offset=1.1,frequency=0.5)
         node = self.node_class()
@@ -4275,7 +4200,7 @@ class TestHeadingContinuous(unittest.TestCase, NodeTest):
         self.assertEqual(node.frequency, 1,0)
 
     def test_heading_continuous_merged_rollover(self):
-        hdg = P('Heading',np.ma.remainder(np.ma.arange(10)+355,360.0))
+        hdg = P('Heading',np.ma.array((np.arange(10.0) + 355.0) % 360.0))
         hdg_ca = P('Heading (Capt)',np.ma.array([358,2,6,10, 14.0]),offset=0.1,frequency=0.5)
         hdg_ca.array[2]=np.ma.masked
         hdg_fo = P('Heading (FO)',np.ma.array([346,350,354,358,2.0]),offset=1.1,frequency=0.5)
@@ -4291,14 +4216,14 @@ class TestHeadingContinuous(unittest.TestCase, NodeTest):
         self.assertEqual(node.frequency, 1,0)
 
     def test_heading_continuous_not_hercules(self):
-        hdg = P('Heading',np.ma.array(data=[10]*60, mask=[0]*20+[1]*20+[0]*20, dtype=float))
+        hdg = P('Heading',np.ma.array(data=np.full(60, 10.0), mask=self.gap_mask.copy()))
         con_hdg = HeadingContinuous()
         con_hdg.derive(hdg, None, None, None)
         # REPAIR_DURATION is limited to 10 seconds, so this should not be repaired.
         self.assertEqual(np.ma.count(con_hdg.array), 40)
 
     def test_heading_continuous_hercules(self):
-        hdg = P('Heading', np.ma.array(data=[10]*60, mask=[0]*20+[1]*20+[0]*20, dtype=float))
+        hdg = P('Heading', np.ma.array(data=np.full(60, 10.0), mask=self.gap_mask.copy()))
         con_hdg = HeadingContinuous()
         herc = A('Frame', 'L382-Hercules')
         con_hdg.derive(hdg, None, None, herc)
@@ -4326,8 +4251,16 @@ class TestTrack(unittest.TestCase, NodeTest):
                   array=np.ma.array([0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.0]))
         node = self.node_class()
         node.derive(heading, drift)
-        expected = [15.0, 30.0, 60.0, 120.0, 240.0, 0.0, 90.0, 180.0, 270.0, 0.0]
-        assert_equal(node.array, expected)
+        np.testing.assert_array_equal(node.array, TRACK_EXPECTED)
+        self.assertEqual(node.array.dtype, np.float64)
+
+    def test_derive_integer(self):
+        heading = P('Heading', array=np.ma.array([10, 350, 359, 720]))
+        drift = P('Drift', array=np.ma.array([5, 20, 1, 0]))
+        node = self.node_class()
+        node.derive(heading, drift)
+        np.testing.assert_array_equal(node.array, [15.0, 10.0, 0.0, 0.0])
+        self.assertEqual(node.array.dtype, np.float64)
 
 
 class TestTrackTrue(unittest.TestCase, NodeTest):
@@ -4343,8 +4276,8 @@ class TestTrackTrue(unittest.TestCase, NodeTest):
                       array=np.ma.array([0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2, 0.1, 0.0]))
         node = self.node_class()
         node.derive(heading, drift)
-        expected = [15.0, 30.0, 60.0, 120.0, 240.0, 0.0, 90.0, 180.0, 270.0, 0.0]
-        assert_equal(node.array, expected)
+        np.testing.assert_array_equal(node.array, TRACK_EXPECTED)
+        self.assertEqual(node.array.dtype, np.float64)
 
     #def test_derive_basic(self):
         #heading = Parameter('Heading True', array=np.ma.arange(0, 100, 10, dtype=np.float64))
@@ -4926,8 +4859,8 @@ class TestHeadingRate(unittest.TestCase):
 
     def test_sample_long_gentle_turn(self):
         # Sample taken from a long circling hold pattern
-        path = os.path.join(test_data_path, 'heading_continuous_in_hold.npz')
-        head_cont = P(array=np.ma.array(load_compressed(path)), frequency=2)
+        head_cont = P(array=np.ma.array(load_test_array('heading_continuous_in_hold.npz')),
+                      frequency=2)
         rot = HeadingRate()
         rot.get_derived((head_cont,))
         np.testing.assert_allclose(rot.array[50:1150],